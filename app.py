@@ -1,12 +1,17 @@
 import streamlit as st
 import pandas as pd
-import requests
 import asyncio
+import aiohttp
 import disnake  # Using disnake, a modern fork of discord.py
 import json
+try:
+    import orjson  # Much faster JSON encode/decode for the cache files
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
 import os
 import time
 from datetime import datetime
+from functools import lru_cache
 import html  # <-- CRITICAL FIX 1: Import HTML library for escaping
 
 # --- Page Configuration ---
@@ -20,106 +25,333 @@ st.set_page_config(
 # Get the absolute path of the directory where this script is.
 CWD = os.path.dirname(__file__) 
 CSV_FILE_PATH = os.path.join(CWD, "users.csv")
-DISCORD_DATA_PATH = os.path.join(CWD, "discord_data.json")
+DISCORD_DATA_PATH = os.path.join(CWD, "discord_data.json") # Only written when DEBUG_DUMP is on
 COMBINED_DATA_PATH = os.path.join(CWD, "combined_data.json")
+# Per-ID lookup caches, so a refresh only hits the APIs for new or expired entries
+CACHE_DIR = os.path.join(CWD, ".cache")
+DISCORD_MEMBER_CACHE_PATH = os.path.join(CACHE_DIR, "discord_users.json")
+ROBLOX_CREATED_CACHE_PATH = os.path.join(CACHE_DIR, "roblox_created.json")
+ROBLOX_AVATAR_CACHE_PATH = os.path.join(CACHE_DIR, "roblox_avatars.json")
+
+# Set to True to also save the raw Discord data to DISCORD_DATA_PATH for debugging
+DEBUG_DUMP = False
+
+# --- JSON File Helpers ---
+
+def write_json(path, data):
+    """Encodes `data` as compact JSON in memory, then writes it to `path` in one go."""
+    if orjson:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(",", ":")).encode()
+    with open(path, "wb") as f:
+        f.write(payload)
+
+def write_json_records(path, records):
+    """
+    Writes a list of records as a JSON array one record at a time, so the encoded file is never
+    held in memory next to the records. Goes through a temp file so readers never see a partial array.
+    """
+    def dumps(record):
+        if orjson:
+            return orjson.dumps(record)
+        return json.dumps(record, separators=(",", ":")).encode()
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"[")
+            for i, record in enumerate(records):
+                if i:
+                    f.write(b",")
+                f.write(dumps(record))
+            f.write(b"]")
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a half-written temp file behind if encoding or writing fails
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def read_json(path):
+    """Reads and decodes a JSON file. Raises json.JSONDecodeError if it's malformed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def load_id_cache(path):
+    """Loads a lookup cache (a JSON object keyed by ID). Returns {} if it's missing or unreadable."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        return read_json(path)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def save_id_cache(path, cache):
+    """Writes a lookup cache, creating the cache directory if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_json(path, cache)
 
 
 # --- Roblox API Constants ---
 ROBLOX_AVATAR_SIZE = "150x150"
 ROBLOX_AVATAR_PLACEHOLDER = "https://placehold.co/150x150/5865F2/FFFFFF?text=N/A"
+ROBLOX_BATCH_SIZE = 100 # Max usernames/IDs the batch endpoints accept per request
+ROBLOX_MAX_CONCURRENCY = 20 # Max in-flight requests for per-user lookups
+ROBLOX_REQUEST_TIMEOUT = 10 # Seconds, so a hung connection can't block the refresh
+ROBLOX_MAX_RETRIES = 3
+ROBLOX_RETRY_STATUSES = (429, 500, 502, 503, 504)
+ROBLOX_MAX_RATE_LIMIT_WAIT = 30 # Seconds; caps how long a Retry-After/x-ratelimit-reset header can pause requests
+ROBLOX_AVATAR_CACHE_TTL = 7 * 24 * 3600 # Seconds before a cached avatar URL is re-fetched; creation dates never expire
+
+# --- Discord Constants ---
+# createdAt never changes, but names and joinedAt do, and a member can only be fetched as a whole
+DISCORD_CACHE_TTL = 3600 # Seconds before a cached member is re-fetched
+DISCORD_MAX_CONCURRENCY = 10 # Max in-flight fetch_member REST calls
 
 # --- Helper Functions for Roblox API ---
 
-def get_roblox_ids(usernames):
-    """Fetches Roblox User IDs from a list of usernames."""
+def _roblox_client_session():
+    """
+    Creates the pooled session shared by every Roblox call in a refresh,
+    so keep-alive connections are reused instead of doing a new TCP+TLS handshake per request.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=ROBLOX_MAX_CONCURRENCY),
+        timeout=aiohttp.ClientTimeout(total=ROBLOX_REQUEST_TIMEOUT),
+    )
+
+# time.monotonic() before which no Roblox request is sent. Set from the rate-limit headers,
+# so one throttled response pauses every in-flight lookup instead of each finding out with its own 429
+_roblox_resume_at = 0.0
+
+def _header_number(headers, name):
+    """Reads a numeric header (e.g. a request count), or None if it's missing or not a number."""
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+def _header_seconds(headers, name):
+    """Reads a rate-limit wait header in seconds, capped at ROBLOX_MAX_RATE_LIMIT_WAIT, or None."""
+    seconds = _header_number(headers, name)
+    return None if seconds is None else min(seconds, ROBLOX_MAX_RATE_LIMIT_WAIT)
+
+async def _roblox_request(session, method, url, **kwargs):
+    """
+    Sends a Roblox API request and returns the JSON body, retrying on 429/5xx.
+    Waits only as long as the rate-limit headers ask, falling back to exponential backoff
+    when they're missing or don't ask for a wait.
+    """
+    global _roblox_resume_at
+    for attempt in range(ROBLOX_MAX_RETRIES + 1):
+        wait = _roblox_resume_at - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        async with session.request(method, url, **kwargs) as response:
+            if _header_number(response.headers, "x-ratelimit-remaining") == 0:
+                # Quota used up: hold every request until the window resets rather than collecting 429s
+                reset = _header_seconds(response.headers, "x-ratelimit-reset")
+                if reset:
+                    _roblox_resume_at = max(_roblox_resume_at, time.monotonic() + reset)
+            if response.status not in ROBLOX_RETRY_STATUSES or attempt == ROBLOX_MAX_RETRIES:
+                response.raise_for_status()
+                return await response.json()
+            retry_after = _header_seconds(response.headers, "retry-after")
+        if retry_after is not None and retry_after > 0:
+            _roblox_resume_at = max(_roblox_resume_at, time.monotonic() + retry_after)
+        else:
+            await asyncio.sleep(0.2 * 2 ** attempt)
+
+def _chunks(items, size):
+    """Splits a list into consecutive chunks of at most `size` items."""
+    return [items[i:i+size] for i in range(0, len(items), size)]
+
+def _valid_roblox_ids(user_ids):
+    """Drops None, 0, or pd.NA IDs and duplicates, so each ID is only requested once."""
+    return sorted({int(uid) for uid in user_ids if uid and pd.notna(uid)})
+
+async def get_roblox_ids(session, usernames):
+    """Fetches Roblox User IDs from a list of usernames, sending the batches of 100 concurrently."""
     url = "https://users.roblox.com/v1/usernames/users"
     # Ensure usernames is a list of strings
     usernames = [str(u) for u in usernames if u and pd.notna(u)]
     if not usernames:
         return {}
-        
-    payload = {"usernames": usernames, "excludeBannedUsers": True}
-    try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json().get("data", [])
-        # Create a map of {lowercase_username: id}
-        return {user["requestedUsername"].lower(): user["id"] for user in data}
-    except requests.RequestException as e:
-        st.error(f"Error fetching Roblox IDs: {e}")
-        return {}
 
-def get_roblox_creation_dates(user_ids):
-    """Fetches Roblox creation dates from a list of user IDs."""
-    dates_map = {}
-    # Filter out any None, 0, or pd.NA IDs
-    valid_ids = [str(uid) for uid in user_ids if uid and pd.notna(uid)]
+    errors = [] # Reported once after the gather, not as one element per failed batch
+
+    async def fetch_batch(batch):
+        payload = {"usernames": batch, "excludeBannedUsers": True}
+        try:
+            return (await _roblox_request(session, "POST", url, json=payload)).get("data", [])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            errors.append(str(e))
+            return []
+
+    username_batches = _chunks(usernames, ROBLOX_BATCH_SIZE)
+    batches = await asyncio.gather(*(fetch_batch(batch) for batch in username_batches))
+    if errors:
+        st.error(f"Error fetching Roblox IDs ({len(errors)}/{len(username_batches)} batches failed): {'; '.join(dict.fromkeys(errors))}")
+    # Create a map of {lowercase_username: id}
+    return {user["requestedUsername"].lower(): user["id"] for data in batches for user in data}
+
+async def get_roblox_creation_dates(session, user_ids, use_cache=True):
+    """
+    Fetches Roblox creation dates in one concurrent wave, at most ROBLOX_MAX_CONCURRENCY at a time.
+    Creation dates never change, so any ID already in the on-disk cache is never requested again,
+    unless `use_cache` is False.
+    """
+    valid_ids = _valid_roblox_ids(user_ids)
     if not valid_ids:
         return {}
     
-    st.write(f"Fetching creation dates for {len(valid_ids)} users...")
-    for user_id in valid_ids:
+    cache = load_id_cache(ROBLOX_CREATED_CACHE_PATH)
+    cached_ids = {uid for uid in valid_ids if str(uid) in cache} if use_cache else set()
+    dates_map = {uid: cache[str(uid)] for uid in cached_ids}
+    missing_ids = [uid for uid in valid_ids if uid not in cached_ids]
+    st.write(f"Fetching creation dates for {len(missing_ids)} users ({len(dates_map)} cached)...")
+    if not missing_ids:
+        return dates_map
+    sem = asyncio.Semaphore(ROBLOX_MAX_CONCURRENCY)
+
+    async def fetch_one(user_id):
         url = f"https://users.roblox.com/v1/users/{user_id}"
-        try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                dates_map[int(user_id)] = response.json().get("created")
-            else:
-                dates_map[int(user_id)] = None
-        except requests.RequestException:
-            dates_map[int(user_id)] = None
-        time.sleep(0.05) # Add a small delay to avoid rate limiting
+        async with sem:
+            try:
+                return user_id, (await _roblox_request(session, "GET", url)).get("created")
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return user_id, None
+
+    fetched = dict(await asyncio.gather(*(fetch_one(uid) for uid in missing_ids)))
+    dates_map.update(fetched)
+    failed = sum(1 for created in fetched.values() if not created)
+    if failed:
+        st.warning(f"Could not fetch creation dates for {failed}/{len(missing_ids)} Roblox users.")
+    # Failed lookups (None) aren't cached, so they're retried next refresh
+    cache.update({str(uid): created for uid, created in fetched.items() if created})
+    await asyncio.to_thread(save_id_cache, ROBLOX_CREATED_CACHE_PATH, cache)
     return dates_map
 
-def get_roblox_avatar_urls(user_ids):
-    """Fetches Roblox avatar headshots in batches of 100."""
-    # Filter out any None, 0, or pd.NA IDs
-    valid_ids = [str(uid) for uid in user_ids if uid and pd.notna(uid)]
+async def get_roblox_avatar_urls(session, user_ids, use_cache=True):
+    """
+    Fetches Roblox avatar headshots in batches of 100, sending the batches concurrently.
+    URLs fetched within the last ROBLOX_AVATAR_CACHE_TTL seconds come from the on-disk cache instead,
+    unless `use_cache` is False.
+    """
+    valid_ids = _valid_roblox_ids(user_ids)
     if not valid_ids:
         return {}
     
-    st.write(f"Fetching avatars for {len(valid_ids)} users...")
+    cache = load_id_cache(ROBLOX_AVATAR_CACHE_PATH)
+    now = time.time()
     avatar_map = {}
-    
-    # --- FIX: Batch the requests in chunks of 100 ---
-    for i in range(0, len(valid_ids), 100):
-        batch_ids = valid_ids[i:i+100]
-        st.write(f"  > Fetching avatar batch {i//100 + 1}...")
-        
-        url = "https://thumbnails.roblox.com/v1/users/avatar-headshot"
+    missing_ids = []
+    for uid in valid_ids:
+        entry = cache.get(str(uid))
+        if use_cache and entry and now - entry["fetchedAt"] < ROBLOX_AVATAR_CACHE_TTL:
+            avatar_map[uid] = entry["data"]
+        else:
+            missing_ids.append(uid)
+    if not missing_ids:
+        return avatar_map
+
+    batches = _chunks(missing_ids, ROBLOX_BATCH_SIZE)
+    st.write(f"Fetching avatars for {len(missing_ids)} users in {len(batches)} batches ({len(avatar_map)} cached)...")
+    url = "https://thumbnails.roblox.com/v1/users/avatar-headshot"
+
+    errors = [] # Reported once after the gather, not as one element per failed batch
+
+    async def fetch_batch(batch_ids):
         params = {
-            "userIds": ",".join(batch_ids),
+            "userIds": ",".join(map(str, batch_ids)),
             "size": ROBLOX_AVATAR_SIZE,
             "format": "Png",
-            "isCircular": False
+            "isCircular": "false"
         }
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json().get("data", [])
-            # Create a map of {userId (int): imageUrl}
-            for avatar in data:
-                avatar_map[avatar["targetId"]] = avatar["imageUrl"]
-        except requests.RequestException as e:
-            st.error(f"Error fetching Roblox avatar batch: {e}")
-        # Add a small delay between batches
-        time.sleep(0.1)
-            
+            return (await _roblox_request(session, "GET", url, params=params)).get("data", [])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            errors.append(str(e))
+            return []
+
+    results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+    if errors:
+        st.error(f"Error fetching Roblox avatars ({len(errors)}/{len(batches)} batches failed): {'; '.join(dict.fromkeys(errors))}")
+    # Create a map of {userId (int): imageUrl}
+    fetched = {avatar["targetId"]: avatar["imageUrl"] for data in results for avatar in data}
+    avatar_map.update(fetched)
+    fetched_at = time.time()
+    # Avatars that aren't ready yet come back without a URL; leave those uncached
+    cache.update({str(uid): {"fetchedAt": fetched_at, "data": url} for uid, url in fetched.items() if url})
+    await asyncio.to_thread(save_id_cache, ROBLOX_AVATAR_CACHE_PATH, cache)
     return avatar_map
 
+async def fetch_roblox_data(usernames, use_cache=True):
+    """
+    Resolves usernames to IDs, then fetches avatars and creation dates concurrently.
+    With `use_cache` False, cached avatars and creation dates are re-fetched.
+    Returns (id_map, avatar_url_map, creation_date_map).
+    """
+    async with _roblox_client_session() as session:
+        id_map = await get_roblox_ids(session, usernames)
+        st.write(f"Found {len(id_map)} matching Roblox IDs.")
+        avatar_url_map, creation_date_map = await asyncio.gather(
+            get_roblox_avatar_urls(session, id_map.values(), use_cache),
+            get_roblox_creation_dates(session, id_map.values(), use_cache),
+        )
+    return id_map, avatar_url_map, creation_date_map
+
 # --- Helper Function for Discord Bot ---
 
-async def fetch_discord_data(guild_id, bot_token, target_ids):
-    """Connects to Discord and fetches data for specific user IDs."""
+async def fetch_discord_data(guild_id, bot_token, target_ids, use_cache=True):
+    """
+    Connects to Discord and fetches data for specific user IDs.
+    Members fetched within the last DISCORD_CACHE_TTL seconds are served from the member cache instead,
+    unless `use_cache` is False.
+    """
+    # Validate IDs in one pass up front, so the cache check and the bot only ever see numeric IDs
+    clean_ids = []
+    invalid_ids = []
+    for user_id in dict.fromkeys(target_ids): # Dedupe, keeping CSV order
+        if user_id and str(user_id).isdigit():
+            clean_ids.append(user_id)
+        else:
+            invalid_ids.append(user_id)
+    if invalid_ids:
+        st.warning(f"Skipping {len(invalid_ids)} invalid Discord ID(s) in CSV: {', '.join(map(str, invalid_ids))}")
+
+    member_cache = load_id_cache(DISCORD_MEMBER_CACHE_PATH)
+    now = time.time()
+    discord_data = {}
+    fetch_ids = []
+    for user_id in clean_ids:
+        entry = member_cache.get(f"{guild_id}:{user_id}")
+        if use_cache and entry and now - entry["fetchedAt"] < DISCORD_CACHE_TTL:
+            discord_data[user_id] = entry["data"]
+        else:
+            fetch_ids.append(user_id)
+    st.write(f"Using cached data for {len(discord_data)} members, fetching {len(fetch_ids)}...")
+
+    if not fetch_ids:
+        return discord_data
     
-    intents = disnake.Intents.default()
-    intents.members = True # MUST have this intent enabled
+    # Only subscribe to what the bot uses, so the gateway doesn't stream
+    # message/presence/typing events that would just be decoded and dropped
+    intents = disnake.Intents(guilds=True, members=True) # members MUST be enabled
     
-    client = disnake.Client(intents=intents)
-    discord_data = {}
+    # Members are cached by chunking just the target guild in on_ready, not every guild the bot is in
+    client = disnake.Client(
+        intents=intents,
+        chunk_guilds_at_startup=False,
+        member_cache_flags=disnake.MemberCacheFlags.from_intents(intents),
+    )
+    bot_finished = False
 
     @client.event
     async def on_ready():
+        nonlocal bot_finished
         st.write(f"Bot connected as {client.user}...")
         try:
             guild = client.get_guild(int(guild_id))
@@ -128,14 +360,25 @@ async def fetch_discord_data(guild_id, bot_token, target_ids):
                 await client.close()
                 return
 
-            st.write(f"Found guild: {guild.name}. Fetching {len(target_ids)} members...")
-            fetch_count = 0
-            for user_id in target_ids:
-                if not user_id or not str(user_id).isdigit():
-                    st.warning(f"Skipping invalid Discord ID in CSV: {user_id}")
-                    continue
+            st.write(f"Found guild: {guild.name}. Fetching {len(fetch_ids)} members...")
+            # Load the guild's whole member list into the cache over the gateway in one operation,
+            # so members can be looked up in memory instead of making a request per member
+            if not guild.chunked:
+                await guild.chunk(cache=True)
+
+            sem = asyncio.Semaphore(DISCORD_MAX_CONCURRENCY)
+            # Collected while the lookups run and reported once each, instead of one element per member
+            missing_ids = []
+            fetch_errors = []
+
+            async def fetch_one(user_id):
+                """Fills in discord_data for one member. Returns True if the member was found."""
                 try:
-                    member = await guild.fetch_member(int(user_id))
+                    member = guild.get_member(int(user_id))
+                    if not member:
+                        # Only hit the REST API for members missing from the cache (e.g. they left the server)
+                        async with sem:
+                            member = await guild.fetch_member(int(user_id))
                     if member:
                         # --- FIX: Get attributes directly from member object ---
                         # This fixes the "'Member' object has no attribute 'user'" bug
@@ -145,20 +388,25 @@ async def fetch_discord_data(guild_id, bot_token, target_ids):
                             "createdAt": member.created_at.isoformat(),
                             "joinedAt": member.joined_at.isoformat()
                         }
-                        fetch_count += 1
+                        return True
                 except disnake.NotFound:
-                    st.warning(f"Could not find member with ID: {user_id}. They may have left the server.")
+                    missing_ids.append(user_id)
                     discord_data[user_id] = {"error": "User not found"}
                 except disnake.HTTPException as e:
-                    st.error(f"HTTP error fetching member {user_id}: {e}")
+                    fetch_errors.append(f"{user_id} (HTTP error: {e})")
                 except Exception as e:
-                    st.error(f"Unknown error fetching member {user_id}: {e}")
-            
-            st.write(f"Successfully fetched {fetch_count}/{len(target_ids)} members.")
+                    fetch_errors.append(f"{user_id} (unknown error: {e})")
+                return False
+
+            # The REST fallbacks overlap instead of running one after another
+            fetch_count = sum(await asyncio.gather(*(fetch_one(uid) for uid in fetch_ids)))
+            if missing_ids:
+                st.warning(f"Could not find {len(missing_ids)} member(s); they may have left the server: {', '.join(missing_ids)}")
+            if fetch_errors:
+                st.error(f"Error fetching {len(fetch_errors)} member(s): {'; '.join(fetch_errors)}")
             
-            with open(DISCORD_DATA_PATH, "w") as f:
-                json.dump(discord_data, f, indent=2)
-            st.success(f"Saved Discord data to {DISCORD_DATA_PATH}")
+            st.write(f"Successfully fetched {fetch_count}/{len(fetch_ids)} members.")
+            bot_finished = True
 
         except Exception as e:
             st.error("An error occurred during bot operation:")
@@ -175,15 +423,107 @@ async def fetch_discord_data(guild_id, bot_token, target_ids):
     except Exception as e:
         st.error("An error occurred while starting the bot:")
         st.exception(e)
+
+    # Remember this run's results so the next refresh can skip these members
+    fetched_at = time.time()
+    for user_id in fetch_ids:
+        if user_id in discord_data:
+            member_cache[f"{guild_id}:{user_id}"] = {"fetchedAt": fetched_at, "data": discord_data[user_id]}
+    # Write from a worker thread so the disk I/O doesn't stall the event loop
+    await asyncio.to_thread(save_id_cache, DISCORD_MEMBER_CACHE_PATH, member_cache)
         
-    return discord_data
+    # None tells the caller the bot run failed, rather than that every member is missing
+    return discord_data if bot_finished else None
+
+# --- Data Combining ---
+
+def _non_empty(series):
+    """Treats empty strings as missing, so fillna() chains behave like `a or b or c`."""
+    return series.replace("", pd.NA)
+
+def _name_after_separator(display_name):
+    """Returns the part after '・' (e.g. "Rank・Name" -> "Name"), or None if there's no '・'."""
+    if not isinstance(display_name, str):
+        return None
+    _, sep, name = display_name.partition("・") # One scan, and no list like split() builds
+    return name.strip() if sep else None
+
+def format_date_series(dates):
+    """Vectorized format_date: formats a Series of ISO date strings to "Jan 02, 2024" in one pass."""
+    dates = dates.astype(object) # An all-missing column comes back as float, which has no .str
+    # Split at the 'T' or ' ' to get just the date part
+    date_part = dates.str.split("T").str[0].str.split(" ").str[0]
+    parsed = pd.to_datetime(date_part, format="%Y-%m-%d", errors="coerce")
+    formatted = parsed.dt.strftime("%b %d, %Y").where(parsed.notna(), "Invalid Date")
+    return formatted.where(_non_empty(dates).notna(), "N/A")
+
+def combine_user_data(df_csv, discord_data_map, avatar_url_map, creation_date_map):
+    """
+    Joins the CSV rows (indexed by DiscordID) with the Discord and Roblox lookups
+    using pandas joins, and returns the records saved to combined_data.json.
+    """
+    # Flatten the Discord records into columns in one pass; "error" entries just leave the fields empty
+    df_discord = (
+        pd.json_normalize(list(discord_data_map.values()))
+        .reindex(columns=["username", "displayName", "createdAt", "joinedAt"])
+        .set_axis(pd.Index(list(discord_data_map.keys()), dtype=object))
+    )
+    # One row per Roblox ID, so the avatar and creation date come across in a single join
+    df_roblox = pd.DataFrame({
+        "robloxAvatarUrl": pd.Series(avatar_url_map, dtype=object),
+        "robloxCreationDate": pd.Series(creation_date_map, dtype=object),
+    })
+    # df_csv is indexed by DiscordID, so this is an index-on-index join
+    df = df_csv.join(df_discord, how="left").join(df_roblox, on="RobloxID")
+    df["discordId"] = df["DiscordID"].map(str)
+
+    # --- ROBUST FALLBACK LOGIC ---
+    discord_user = _non_empty(df["username"]).fillna(df["DiscordUsername"]).fillna("N/A")
+    # Use the part after '・' if present (e.g. "Rank・Name" -> "Name"), otherwise fall back to the raw name, then the username
+    raw_display_name = df["displayName"].astype(object) # An all-missing column comes back as float
+    discord_display = (
+        raw_display_name.map(_name_after_separator)
+        .fillna(_non_empty(raw_display_name))
+        .fillna(discord_user)
+    )
+
+    has_roblox_id = df["RobloxID"].notna()
+    out = pd.DataFrame({
+        "discordUsername": discord_user,
+        "discordDisplayName": discord_display, # This is now the parsed name
+        "discordId": df["discordId"],
+        "discordJoinDate": df["joinedAt"],
+        "discordCreationDate": df["createdAt"],
+        "robloxUsername": _non_empty(df["RobloxUsername"]).fillna("N/A"),
+        "robloxId": df["RobloxID"].astype(object).where(has_roblox_id, "N/A"),
+        "robloxCreationDate": df["robloxCreationDate"],
+        "robloxAvatarUrl": _non_empty(df["robloxAvatarUrl"]).fillna(ROBLOX_AVATAR_PLACEHOLDER), # "" for blocked/pending headshots
+    })
+    # Pre-format the dates once here so the UI doesn't re-parse them on every rerun
+    for field in ("discordJoinDate", "discordCreationDate", "robloxCreationDate"):
+        out[f"{field}Fmt"] = format_date_series(out[field])
+    # Missing values become null in the JSON
+    return out.astype(object).where(out.notna(), None).to_dict("records")
 
 # --- Main Data Refresh Function ---
 
-def refresh_all_data():
+async def fetch_all_data(guild_id, bot_token, target_discord_ids, roblox_usernames, use_cache=True):
+    """
+    Runs the Discord bot and the Roblox lookups concurrently, so the bot's
+    login and gateway handshake overlap the Roblox HTTP work.
+    Returns (discord_data, (roblox_id_map, avatar_url_map, creation_date_map)).
+    """
+    return await asyncio.gather(
+        fetch_discord_data(guild_id, bot_token, target_discord_ids, use_cache),
+        fetch_roblox_data(roblox_usernames, use_cache),
+    )
+
+def refresh_all_data(use_cache=True):
     """
     This is the main function. It reads the CSV, runs the bot,
     fetches Roblox data, and saves a combined JSON file.
+    With `use_cache` False, every member, avatar, and creation date is re-fetched
+    instead of being served from the lookup caches (which are then rewritten with the fresh results).
     """
     
     bot_token = st.secrets.get("DISCORD_BOT_TOKEN")
@@ -197,128 +537,91 @@ def refresh_all_data():
     
     try:
         # 1. Read base data from CSV
-        st.info("Step 1/6: Reading users.csv...")
+        st.info("Step 1/4: Reading users.csv...")
         if not os.path.exists(CSV_FILE_PATH):
             st.error(f"users.csv not found at {CSV_FILE_PATH}. Please upload it to your GitHub repository.")
             return
             
-        df_csv = pd.read_csv(CSV_FILE_PATH, dtype={"DiscordID": str})
+        df_csv = read_users_csv(get_file_mtime(CSV_FILE_PATH))
         # Clean up IDs
         df_csv["DiscordID"] = df_csv["DiscordID"].str.strip()
-        target_discord_ids = df_csv["DiscordID"].dropna().unique().tolist()
-        
-        # 2. Run Discord Bot Logic
-        st.info("Step 2/6: Fetching Discord data... (This may take a minute)")
-        progress_bar.progress(25, "Connecting to Discord...")
-        # Run the async bot function
-        asyncio.run(fetch_discord_data(guild_id, bot_token, target_discord_ids))
-        
-        if os.path.exists(DISCORD_DATA_PATH):
-            with open(DISCORD_DATA_PATH, "r") as f:
-                discord_data_map = json.load(f)
-        else:
-            st.error("Discord data file was not created. Bot run may have failed. Stopping refresh.")
-            return
-
-        # 3. Fetch Roblox IDs
-        st.info("Step 3/6: Fetching Roblox data...")
-        progress_bar.progress(50, "Fetching Roblox IDs...")
+        # Index by DiscordID once; the combine step joins the Discord data on this index
+        df_csv = df_csv.set_index("DiscordID", drop=False)
+        target_discord_ids = df_csv.index.dropna().unique().tolist()
         
-        roblox_usernames = df_csv["RobloxUsername"].dropna().unique().tolist()
+        # Send the canonical names, so case variants of one account are only looked up once
+        roblox_usernames = df_csv["RobloxUsernameLower"].dropna().unique().tolist()
         if not roblox_usernames:
             st.warning("No Roblox usernames found in users.csv.")
-            roblox_id_map = {}
-        else:
-            st.info(f"Fetching Roblox IDs for {len(roblox_usernames)} unique usernames...")
-            roblox_id_map = get_roblox_ids(roblox_usernames)
-            st.write(f"Found {len(roblox_id_map)} matching Roblox IDs.")
-            if len(roblox_id_map) == 0:
-                st.warning("Could not find any Roblox IDs. Usernames may be incorrect or the Roblox API is down.")
-
-        # Map the found IDs back to the DataFrame
-        df_csv["RobloxID"] = df_csv["RobloxUsername"].str.lower().map(roblox_id_map).astype('Int64') # Use nullable int
         
-        # 4. Fetch Roblox Avatars & Creation Dates
-        all_roblox_ids = df_csv["RobloxID"].dropna().unique().tolist()
-        st.info(f"Step 4/6: Fetching avatars and creation dates for {len(all_roblox_ids)} valid Roblox IDs...")
-        progress_bar.progress(75, "Fetching Roblox profiles...")
+        # 2. Run Discord Bot Logic and Roblox lookups concurrently
+        st.info(f"Step 2/4: Fetching Discord data and Roblox data for {len(roblox_usernames)} unique usernames... (This may take a minute)")
+        progress_bar.progress(25, "Fetching Discord and Roblox data...")
+        # Run the async bot function alongside the Roblox fetches
+        discord_data_map, (roblox_id_map, avatar_url_map, creation_date_map) = asyncio.run(
+            fetch_all_data(guild_id, bot_token, target_discord_ids, roblox_usernames, use_cache)
+        )
         
-        avatar_url_map = get_roblox_avatar_urls(all_roblox_ids)
-        creation_date_map = get_roblox_creation_dates(all_roblox_ids)
+        if discord_data_map is None:
+            st.error("Discord data could not be fetched. Bot run may have failed. Stopping refresh.")
+            return
+        if DEBUG_DUMP:
+            write_json(DISCORD_DATA_PATH, discord_data_map)
+            st.write(f"Saved Discord data to {DISCORD_DATA_PATH}")
+
+        if roblox_usernames and len(roblox_id_map) == 0:
+            st.warning("Could not find any Roblox IDs. Usernames may be incorrect or the Roblox API is down.")
         st.write(f"Found {len(avatar_url_map)} avatars and {len(creation_date_map)} creation dates.")
+
+        # Map the found IDs back to the DataFrame
+        df_csv["RobloxID"] = df_csv["RobloxUsernameLower"].map(roblox_id_map).astype('Int64') # Use nullable int
         
-        # 5. Combine all data
-        st.info("Step 5/6: Combining all data...")
+        # 3. Combine all data
+        st.info("Step 3/4: Combining all data...")
         progress_bar.progress(90, "Combining all data...")
-        combined_data = []
-        for _, row in df_csv.iterrows():
-            discord_id = str(row["DiscordID"])
-            roblox_id = row["RobloxID"] if pd.notna(row["RobloxID"]) else None
-            
-            discord_info = discord_data_map.get(discord_id, {})
-            
-            # --- ROBUST FALLBACK LOGIC ---
-            raw_display_name = discord_info.get("displayName")
-            
-            # --- NEW LOGIC: Parse the display name ---
-            if raw_display_name and "・" in raw_display_name:
-                parts = raw_display_name.split("・", 1) # Split only once
-                if len(parts) > 1:
-                    discord_display = parts[1].strip() # Get the part after '・' and remove whitespace
-                else:
-                    # This case handles if '・' is the last character
-                    discord_display = raw_display_name
-            else:
-                # Fallback if '・' is not present or raw_display_name is None
-                discord_display = raw_display_name or discord_info.get("username") or row["DiscordUsername"] or "N/A"
-            # --- END NEW LOGIC ---
-
-            discord_user = discord_info.get("username") or row["DiscordUsername"] or "N/A"
-            roblox_user = row["RobloxUsername"] or "N/A"
-            
-            # Get avatar URL (int key)
-            avatar_url = avatar_url_map.get(roblox_id) if roblox_id else ROBLOX_AVATAR_PLACEHOLDER
-            
-            # Get creation date (int key)
-            roblox_date = creation_date_map.get(roblox_id) if roblox_id else None
-            
-            combined_data.append({
-                "discordUsername": discord_user,
-                "discordDisplayName": discord_display, # This is now the parsed name
-                "discordId": discord_id,
-                "discordJoinDate": discord_info.get("joinedAt"),
-                "discordCreationDate": discord_info.get("createdAt"),
-                "robloxUsername": roblox_user,
-                "robloxId": roblox_id or "N/A",
-                "robloxCreationDate": roblox_date,
-                "robloxAvatarUrl": avatar_url or ROBLOX_AVATAR_PLACEHOLDER,
-            })
-
-        # 6. Save combined data to cache file
-        st.info(f"Step 6/6: Saving {len(combined_data)} records to cache...")
-        with open(COMBINED_DATA_PATH, "w") as f:
-            json.dump(combined_data, f, indent=2)
+        combined_data = combine_user_data(df_csv, discord_data_map, avatar_url_map, creation_date_map)
+
+        # 4. Save combined data to cache file
+        st.info(f"Step 4/4: Saving {len(combined_data)} records to cache...")
+        write_json_records(COMBINED_DATA_PATH, combined_data)
             
         progress_bar.progress(100, "Data refresh complete!")
         st.success("All user data has been refreshed and cached.")
-        # Wait 2 seconds and rerun to show the new data
-        time.sleep(2)
-        st.rerun()
+        # Hand the new records straight to the page below instead of rerunning the script to re-read the file
+        st.session_state["user_data"] = (get_file_mtime(COMBINED_DATA_PATH), combined_data)
         
     except Exception as e:
         st.error("A critical error occurred during the data refresh:")
         st.exception(e) # This will print the full error!
         progress_bar.empty()
 
-# --- Helper to load cached data ---
+# --- Helpers to load cached data ---
+
+def get_file_mtime(path):
+    """Returns the file's modification time, or 0 if it doesn't exist."""
+    return os.path.getmtime(path) if os.path.exists(path) else 0
 
-def load_cached_data():
-    """Loads the combined_data.json file."""
+@st.cache_data(show_spinner=False)
+def read_users_csv(mtime):
+    """Reads users.csv. `mtime` is part of the cache key, so edits to the file are picked up."""
+    df = pd.read_csv(CSV_FILE_PATH, dtype={"DiscordID": str, "RobloxUsername": str})
+    # Roblox usernames are case-insensitive; canonicalize them once here and match on this column,
+    # keeping RobloxUsername as typed for display
+    df["RobloxUsernameLower"] = df["RobloxUsername"].str.strip().str.lower()
+    return df
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_cached_data(mtime):
+    """
+    Loads the combined_data.json file.
+    `mtime` is part of the cache key, so the file is only re-read after a refresh rewrites it.
+    Cached as a resource so reruns share the parsed list instead of unpickling a copy of it
+    each time; the UI only reads it.
+    """
     if not os.path.exists(COMBINED_DATA_PATH):
         return None
     try:
-        with open(COMBINED_DATA_PATH, "r") as f:
-            return json.load(f)
+        return read_json(COMBINED_DATA_PATH)
     except json.JSONDecodeError:
         st.error(f"Could not read cached data file ({COMBINED_DATA_PATH}). It may be corrupted. Try refreshing.")
         return None
@@ -326,6 +629,145 @@ def load_cached_data():
         st.error(f"Error loading cache: {e}")
         return None
 
+SEARCH_FIELDS = ("discordUsername", "robloxUsername", "discordDisplayName")
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_search_index(mtime, _user_data):
+    """
+    Builds a Series with one lowercased search string per user (the SEARCH_FIELDS joined
+    by a separator that can't be typed), in the same order as `_user_data`.
+    Only the data file's mtime is part of the cache key, so it's only rebuilt after a refresh.
+    """
+    df = pd.DataFrame(_user_data, columns=list(SEARCH_FIELDS)).fillna("").astype(str)
+    return df[SEARCH_FIELDS[0]].str.cat([df[field] for field in SEARCH_FIELDS[1:]], sep="\x1f").str.lower()
+
+# --- User Grid ---
+
+NUM_COLUMNS = 4
+PAGE_SIZE = 40 # Cards rendered per page; a multiple of NUM_COLUMNS
+
+def _html_one_line(markup):
+    """
+    Collapses an indented HTML template onto one line. Markdown would otherwise end the
+    HTML block at a blank line and render indented lines as code once cards are concatenated.
+    """
+    return " ".join(line.strip() for line in markup.splitlines() if line.strip())
+
+# Built once at import; each card only fills in the escaped values
+CARD_HTML_TEMPLATE = _html_one_line("""
+<div style="border: 1px solid rgba(250, 250, 250, 0.2); border-radius: 0.5rem; padding: 1rem; min-width: 0;">
+    <div style="display: flex; flex-direction: column; align-items: center; text-align: center; padding: 10px; min-height: 200px;">
+        <img src="{avatar_url}" 
+             style="width: 100px; height: 100px; border-radius: 50%; object-fit: cover; border: 2px solid #5865F2;">
+        <h3 style="color: white; margin-top: 15px; margin-bottom: 0px; font-weight: bold; font-size: 1.1em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: 100%;"
+            title="{roblox_name}">
+            {roblox_name}
+        </h3>
+        <p style="color: #9CA3AF; margin-top: 5px; font-size: 0.9em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: 100%;"
+           title="{discord_name}">
+            {discord_name}
+        </p>
+    </div>
+    <details>
+        <summary style="cursor: pointer;">View Details</summary>
+        <p><b>Discord Username:</b> <code>{discord_username}</code></p>
+        <p><b>Discord ID:</b> <code>{discord_id}</code></p>
+        <p><b>Roblox ID:</b> <code>{roblox_id}</code></p>
+        <hr>
+        <p><b>Server Join Date:</b> {join_date}</p>
+        <p><b>Discord Acct. Creation:</b> {discord_created}</p>
+        <p><b>Roblox Acct. Creation:</b> {roblox_created}</p>
+    </details>
+</div>
+""")
+
+GRID_HTML_TEMPLATE = _html_one_line(f"""
+<div style="display: grid; grid-template-columns: repeat({NUM_COLUMNS}, minmax(0, 1fr)); gap: 16px;">
+    {{cards}}
+</div>
+""")
+
+def render_card(user):
+    """Builds the HTML for one user card, including its "View Details" section."""
+    # --- CRITICAL FIX 3: HTML Escaping ---
+    # This sanitizes names and prevents the UI from breaking
+    # This fixes the "black bar" bug.
+    def escape(key):
+        return html.escape(str(user.get(key, "N/A")))
+
+    def escape_date(key):
+        # Dates are pre-formatted at refresh; format_date only covers caches written before that
+        return html.escape(str(user.get(f"{key}Fmt") or format_date(user.get(key))))
+
+    return CARD_HTML_TEMPLATE.format(
+        avatar_url=escape("robloxAvatarUrl"),
+        roblox_name=escape("robloxUsername"),
+        discord_name=escape("discordDisplayName"), # This will be the parsed name
+        discord_username=escape("discordUsername"),
+        discord_id=escape("discordId"),
+        roblox_id=escape("robloxId"),
+        join_date=escape_date("discordJoinDate"),
+        discord_created=escape_date("discordCreationDate"),
+        roblox_created=escape_date("robloxCreationDate"),
+    )
+
+# --- CRITICAL FIX 2: "Invalid Date" Fix ---
+@lru_cache(maxsize=20000) # Pure, and the same few dates repeat across reruns and users
+def format_date(date_str):
+    """Helper to format ISO date strings to be pretty."""
+    if not date_str:
+        return "N/A"
+    try:
+        # Split at the 'T' or ' ' to get just the date part
+        date_part = date_str.split('T')[0].split(' ')[0]
+        # Parse just the YYYY-MM-DD part
+        dt = datetime.strptime(date_part, "%Y-%m-%d")
+        return dt.strftime("%b %d, %Y")
+    except (ValueError, TypeError, AttributeError):
+        return "Invalid Date" # Return this if parsing fails
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_card_html(mtime, _user_data):
+    """
+    Renders every user's card once, in the same order as `_user_data`, so reruns only join strings.
+    Like build_search_index, only the data file's mtime is part of the cache key.
+    """
+    return [render_card(user) for user in _user_data]
+
+@st.fragment
+def render_user_grid(user_data, data_mtime):
+    """
+    Renders the search box and one page of user cards.
+    As a fragment, searching or changing page only re-runs this function, not the whole script.
+    """
+    search_query = st.text_input("Search by name...", "", placeholder="Search Discord or Roblox username...")
+    
+    # Filter data based on search; works on positions in user_data, which the card list shares
+    if search_query:
+        query = search_query.lower()
+        # One vectorized substring scan over the precomputed index instead of lowercasing every field per keystroke
+        matches = build_search_index(data_mtime, user_data).str.contains(query, regex=False)
+        filtered_ids = matches.index[matches].tolist()
+    else:
+        filtered_ids = range(len(user_data))
+
+    if not filtered_ids:
+        st.warning(f"No users found matching '{search_query}'.")
+    
+    # --- Pagination: only render one page of cards per run ---
+    num_pages = max(1, -(-len(filtered_ids) // PAGE_SIZE)) # Ceiling division
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1) if num_pages > 1 else 1
+    page_ids = filtered_ids[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+    if num_pages > 1:
+        st.caption(f"Showing {(page - 1) * PAGE_SIZE + 1}-{(page - 1) * PAGE_SIZE + len(page_ids)} of {len(filtered_ids)} users.")
+
+    # --- Display User Cards ---
+    # The whole page goes out as one HTML grid in a single markdown call, instead of
+    # a columns/container/expander set of elements per user
+    if page_ids:
+        cards = build_card_html(data_mtime, user_data)
+        st.markdown(GRID_HTML_TEMPLATE.format(cards="".join(cards[i] for i in page_ids)), unsafe_allow_html=True)
+
 # --- Main App UI ---
 
 st.title("✨ Verified User Dashboard")
@@ -342,98 +784,36 @@ with st.sidebar:
         st.info("Enter the admin password to enable data refresh.")
     elif password_input == admin_password:
         st.success("Admin access granted.")
-        if st.button("Refresh All User Data", type="primary", help="This will re-fetch all data from Discord and Roblox"):
+        bypass_cache = st.checkbox(
+            "Bypass lookup caches",
+            help="Re-fetch every member, avatar, and creation date, e.g. after renames or avatar changes.",
+        )
+        refresh_help = (
+            "Re-fetches all data from Discord and Roblox." if bypass_cache else
+            f"Re-reads users.csv. Discord members cached within the last {DISCORD_CACHE_TTL // 60} minutes, "
+            f"avatars within the last {ROBLOX_AVATAR_CACHE_TTL // 86400} days, and all Roblox creation dates "
+            "are reused; only new or expired entries are fetched."
+        )
+        if st.button("Refresh All User Data", type="primary", help=refresh_help):
             with st.spinner("Running full data refresh..."):
-                refresh_all_data()
+                refresh_all_data(use_cache=not bypass_cache)
     else:
         st.error("Incorrect password.")
     
     st.markdown("---")
-    st.caption("Data is cached in `combined_data.json`. Refreshing re-builds this file.")
+    st.caption(
+        "Data is cached in `combined_data.json`. Refreshing re-builds this file, reusing Discord and Roblox "
+        "lookups cached in `.cache/` unless the caches are bypassed."
+    )
 
 
 # --- Main Page Content ---
-user_data = load_cached_data()
+data_mtime = get_file_mtime(COMBINED_DATA_PATH)
+# Data from a refresh in this session is used directly, as long as the file hasn't been rewritten since
+refreshed_mtime, refreshed_data = st.session_state.get("user_data", (None, None))
+user_data = refreshed_data if refreshed_mtime == data_mtime else load_cached_data(data_mtime)
 
 if not user_data:
     st.info("No cached data found. Please ask an admin to log in and refresh the data.")
 else:
-    search_query = st.text_input("Search by name...", "", placeholder="Search Discord or Roblox username...")
-    
-    # Filter data based on search
-    if search_query:
-        query = search_query.lower()
-        filtered_data = [
-            user for user in user_data
-            if query in str(user.get("discordUsername", "")).lower() or
-               query in str(user.get("robloxUsername", "")).lower() or
-               query in str(user.get("discordDisplayName", "")).lower()
-        ]
-    else:
-        filtered_data = user_data
-
-    if not filtered_data:
-        st.warning(f"No users found matching '{search_query}'.")
-    
-    # --- Display User Cards ---
-    num_columns = 4
-    
-    # --- CRITICAL FIX 2: "Invalid Date" Fix ---
-    def format_date(date_str):
-        """Helper to format ISO date strings to be pretty."""
-        if not date_str:
-            return "N/A"
-        try:
-            # Split at the 'T' or ' ' to get just the date part
-            date_part = date_str.split('T')[0].split(' ')[0]
-            # Parse just the YYYY-MM-DD part
-            dt = datetime.strptime(date_part, "%Y-%m-%d")
-            return dt.strftime("%b %d, %Y")
-        except (ValueError, TypeError, AttributeError):
-            return "Invalid Date" # Return this if parsing fails
-
-    # Create a grid of cards
-    for i in range(0, len(filtered_data), num_columns):
-        cols = st.columns(num_columns)
-        for j in range(num_columns):
-            if i + j < len(filtered_data):
-                user = filtered_data[i + j]
-                
-                with cols[j].container(border=True):
-                    
-                    # --- HTML CARD ---
-                    avatar_url = user.get('robloxAvatarUrl')
-                    
-                    # --- CRITICAL FIX 3: HTML Escaping ---
-                    # This sanitizes names and prevents the UI from breaking
-                    # This fixes the "black bar" bug.
-                    roblox_name = html.escape(str(user.get('robloxUsername', "N/A")))
-                    discord_name = html.escape(str(user.get('discordDisplayName', "N/A"))) # This will be the parsed name
-
-                    html_card = f"""
-                    <div style="display: flex; flex-direction: column; align-items: center; text-align: center; padding: 10px; min-height: 200px;">
-                        <img src="{avatar_url}" 
-                             style="width: 100px; height: 100px; border-radius: 50%; object-fit: cover; border: 2px solid #5865F2;">
-                        
-                        <h3 style="color: white; margin-top: 15px; margin-bottom: 0px; font-weight: bold; font-size: 1.1em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: 100%;"
-                            title="{roblox_name}">
-                            {roblox_name}
-                        </h3>
-                        <p style="color: #9CA3AF; margin-top: 5px; font-size: 0.9em; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: 100%;"
-                           title="{discord_name}">
-                            {discord_name}
-                        </p>
-                    </div>
-                    """
-                    st.markdown(html_card, unsafe_allow_html=True)
-                    
-                    with st.expander("View Details"):
-                        st.markdown(f"**Discord Username:** `{html.escape(str(user.get('discordUsername', 'N/A')))}`")
-                        st.markdown(f"**Discord ID:** `{user.get('discordId', 'N/A')}`")
-                        st.markdown(f"**Roblox ID:** `{user.get('robloxId', 'N/A')}`")
-                        st.markdown("---")
-                        # Display the three key dates
-                        st.markdown(f"**Server Join Date:** {format_date(user.get('discordJoinDate'))}")
-                        st.markdown(f"**Discord Acct. Creation:** {format_date(user.get('discordCreationDate'))}")
-                        st.markdown(f"**Roblox Acct. Creation:** {format_date(user.get('robloxCreationDate'))}")
-
+    render_user_grid(user_data, data_mtime)